@@ -2,8 +2,6 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
-import yfinance as yf
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -11,7 +9,10 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.visualization import set_plot_style
+from src.analysis import calculate_correlation, calculate_volatility, sharpe_from_moments
+from src.data_loader import fetch_price_panel
+from src.data_processing import handle_missing_values
+from src.visualization import plot_correlation_heatmap, set_plot_style
 
 st.set_page_config(
     page_title="Market Pulse Dashboard",
@@ -22,6 +23,35 @@ st.set_page_config(
 
 set_plot_style()
 
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def load_prices(tickers: tuple, start, end) -> pd.DataFrame:
+    prices_df = fetch_price_panel(list(tickers), str(start), str(end))
+    return handle_missing_values(prices_df, strategy="forward_backward_fill")
+
+
+# The derived frames below are keyed on the same fetch parameters as load_prices,
+# so reruns (tab switches, widget changes) reuse them without rehashing any frame.
+@st.cache_data(show_spinner=False, ttl=3600)
+def load_returns(tickers: tuple, start, end) -> pd.DataFrame:
+    return load_prices(tickers, start, end).pct_change().dropna()
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def load_rolling_volatility(tickers: tuple, start, end, window: int) -> pd.DataFrame:
+    return calculate_volatility(load_returns(tickers, start, end), window=window)
+
+
+@st.cache_resource
+def upper_triangle_indices(n: int) -> tuple:
+    return np.triu_indices(n, k=1)
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def load_correlation(tickers: tuple, start, end) -> pd.DataFrame:
+    return calculate_correlation(load_returns(tickers, start, end))
+
+
 st.title("📈 Market Pulse: Stock Market Analysis Dashboard")
 st.markdown("""
 **Interactive dashboard for exploring stock market sector dynamics**
@@ -92,32 +122,16 @@ if not st.session_state['fetch_data']:
 else:
     with st.spinner(f"Fetching data for {len(all_tickers)} stocks..."):
         try:
-            prices_list = []
-            for ticker in all_tickers:
-                stock = yf.download(ticker, start=start_date_input, end=end_date_input, progress=False, auto_adjust=True)
-                if not stock.empty:
-                    if isinstance(stock.columns, pd.MultiIndex):
-                        close_price = stock['Close'][ticker] if ticker in stock['Close'].columns else stock['Close'].iloc[:, 0]
-                    else:
-                        close_price = stock['Close'] if 'Close' in stock.columns else stock.iloc[:, 0]
-                    
-                    prices_list.append(pd.Series(close_price.values, index=close_price.index, name=ticker))
-            
-            if not prices_list:
-                st.error("No data fetched. Please check your stock selections and date range.")
-                st.stop()
-            
-            prices_df = pd.concat(prices_list, axis=1)
-            
-            if prices_df.empty:
-                st.error("No data fetched. Please check your stock selections and date range.")
-                st.stop()
-            
-            prices_df = prices_df.ffill().bfill()
-            returns_df = prices_df.pct_change().dropna()
+            fetch_params = (tuple(sorted(all_tickers)), start_date_input, end_date_input)
+            prices_df = load_prices(*fetch_params)
+            returns_df = load_returns(*fetch_params)
             
             st.success(f"✓ Data fetched successfully! {len(prices_df)} trading days")
             
+        except ValueError:
+            # fetch_price_panel raises instead of returning an empty panel
+            st.error("No data fetched. Please check your stock selections and date range.")
+            st.stop()
         except Exception as e:
             st.error(f"Error fetching data: {e}")
             st.stop()
@@ -136,13 +150,12 @@ else:
         normalized_prices = (prices_df / prices_df.iloc[0]) * 100
         
         fig, ax = plt.subplots(figsize=(14, 6))
-        for ticker in all_tickers:
-            ax.plot(normalized_prices.index, normalized_prices[ticker], label=ticker, linewidth=2)
+        ax.plot(normalized_prices.index, normalized_prices.to_numpy(), linewidth=2)
         
         ax.set_title('Normalized Stock Prices (Base = 100)', fontsize=14, fontweight='bold')
         ax.set_xlabel('Date')
         ax.set_ylabel('Normalized Price')
-        ax.legend(loc='best', ncol=2)
+        ax.legend(normalized_prices.columns, loc='best', ncol=2)
         ax.grid(True, alpha=0.3)
         plt.tight_layout()
         st.pyplot(fig)
@@ -160,9 +173,11 @@ else:
     with tab2:
         st.subheader("Returns Analysis")
         
-        annualized_returns = returns_df.mean() * 252
-        annualized_volatility = returns_df.std() * np.sqrt(252)
-        sharpe_ratio = annualized_returns / annualized_volatility
+        mean_returns = returns_df.mean()
+        std_returns = returns_df.std()
+        annualized_returns = mean_returns * 252
+        annualized_volatility = std_returns * np.sqrt(252)
+        sharpe_ratio = sharpe_from_moments(mean_returns, std_returns, risk_free_rate=0.0)
         
         metrics_df = pd.DataFrame({
             'Annual Return (%)': annualized_returns * 100,
@@ -180,8 +195,20 @@ else:
         fig, axes = plt.subplots(2, 3, figsize=(15, 8))
         axes = axes.flatten()
         
+        # Shared bin edges keep the six distributions directly comparable
+        returns_values = returns_df.to_numpy()
+        returns_values = returns_values[np.isfinite(returns_values)]
+        low, high = 0.0, 0.0
+        if returns_values.size:
+            low, high = returns_values.min(), returns_values.max()
+        if low == high:
+            # Degenerate range (no or identical returns): widen it as np.histogram does
+            low, high = low - 0.5, high + 0.5
+        edges = np.linspace(low, high, 51)
         for idx, ticker in enumerate(all_tickers[:6]):
-            axes[idx].hist(returns_df[ticker], bins=50, alpha=0.7, edgecolor='black')
+            counts, _ = np.histogram(returns_df[ticker].dropna().to_numpy(), bins=edges)
+            axes[idx].bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                          alpha=0.7, edgecolor='black')
             axes[idx].set_title(f'{ticker}', fontweight='bold')
             axes[idx].set_xlabel('Daily Return')
             axes[idx].set_ylabel('Frequency')
@@ -193,17 +220,16 @@ else:
     with tab3:
         st.subheader(f"{volatility_window}-Day Rolling Volatility")
         
-        rolling_vol = returns_df.rolling(window=volatility_window).std() * np.sqrt(252)
+        rolling_vol = load_rolling_volatility(*fetch_params, volatility_window)
         
         fig, ax = plt.subplots(figsize=(14, 6))
-        for ticker in all_tickers:
-            ax.plot(rolling_vol.index, rolling_vol[ticker], label=ticker, linewidth=2)
+        ax.plot(rolling_vol.index, rolling_vol.to_numpy(), linewidth=2)
         
         ax.set_title(f'{volatility_window}-Day Rolling Volatility (Annualized)', 
                     fontsize=14, fontweight='bold')
         ax.set_xlabel('Date')
         ax.set_ylabel('Volatility')
-        ax.legend(loc='best', ncol=2)
+        ax.legend(rolling_vol.columns, loc='best', ncol=2)
         ax.grid(True, alpha=0.3)
         plt.tight_layout()
         st.pyplot(fig)
@@ -223,25 +249,30 @@ else:
     with tab4:
         st.subheader("Correlation Matrix")
         
-        corr_matrix = returns_df.corr()
+        corr_matrix = load_correlation(*fetch_params)
         
-        fig, ax = plt.subplots(figsize=(10, 8))
-        sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='RdBu_r', 
-                   center=0, square=True, linewidths=1, ax=ax,
-                   cbar_kws={"shrink": 0.8})
-        ax.set_title('Stock Returns Correlation Matrix', fontsize=14, fontweight='bold')
-        plt.tight_layout()
+        fig = plot_correlation_heatmap(corr_matrix, cmap='RdBu_r', fmt='.2f')
         st.pyplot(fig)
         
         st.subheader("Correlation Insights")
         
-        corr_values = corr_matrix.values[np.triu_indices_from(corr_matrix.values, k=1)]
+        rows, cols = upper_triangle_indices(len(corr_matrix))
+        corr_values = corr_matrix.to_numpy()[rows, cols]
         
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Average Correlation", f"{corr_values.mean():.3f}")
-        with col2:
-            st.metric("Max Correlation", f"{corr_values.max():.3f}")
+        # Zero-variance tickers give NaN correlations; leave them out of the insights
+        if np.isfinite(corr_values).any():
+            top = np.nanargmax(corr_values)
+            top_pair = f"{corr_matrix.index[rows[top]]} / {corr_matrix.columns[cols[top]]}"
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Average Correlation", f"{np.nanmean(corr_values):.3f}")
+            with col2:
+                st.metric("Max Correlation", f"{corr_values[top]:.3f}")
+            with col3:
+                st.metric("Min Correlation", f"{np.nanmin(corr_values):.3f}")
+            with col4:
+                st.metric("Most Correlated Pair", top_pair)
     
     with tab5:
         st.subheader("Risk-Return Profile")
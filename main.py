@@ -4,8 +4,7 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.append(str(src_path))
 
-from data_loader import fetch_stock_data, save_dataframe
-from data_processing import calculate_returns, pivot_stock_data
+from data_loader import fetch_price_panel, save_dataframe
 from analysis import calculate_correlation, calculate_volatility, calculate_descriptive_stats
 from visualization import (
     plot_stock_prices, 
@@ -15,6 +14,7 @@ from visualization import (
     set_plot_style
 )
 import pandas as pd
+import polars as pl
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 
@@ -31,22 +31,31 @@ def main():
     # Fetch data
     print("\n1. Fetching stock data...")
     end_date = datetime.now().strftime('%Y-%m-%d')
-    stock_data = fetch_stock_data(
+    prices = fetch_price_panel(
         tickers=all_stocks,
         start_date='2020-01-01',
-        end_date=end_date
+        end_date=end_date,
+        dtype='float64'
     )
     
-    # Save raw data
-    save_dataframe(stock_data, 'data/raw/stock_prices.csv')
+    # Save raw data: the full-precision date x ticker panel of closing prices
+    save_dataframe(prices.reset_index(), 'data/raw/stock_prices.parquet', format='parquet')
     
-    # Calculate returns
+    # Calculate returns on the wide date x ticker panel (float32 is ample for returns).
+    # Each return is taken against the ticker's last valid close, so a missing day
+    # stays null without also nulling the return on the day after it.
     print("\n2. Calculating returns...")
-    stock_data = calculate_returns(stock_data)
+    close = pl.exclude('Date').cast(pl.Float32)
+    returns_pivot = (
+        pl.from_pandas(prices.reset_index())
+        .sort('Date')
+        .select('Date', close / close.forward_fill().shift(1) - 1)
+        .to_pandas()
+        .set_index('Date')
+    )
     
-    # Pivot data for correlation analysis
+    # Correlation analysis
     print("\n3. Analyzing correlations...")
-    returns_pivot = pivot_stock_data(stock_data, values_col='Returns')
     correlation_matrix = calculate_correlation(returns_pivot)
     
     # Calculate statistics
@@ -56,26 +65,30 @@ def main():
     print(stats)
     
     # Save processed data
-    save_dataframe(returns_pivot, 'data/processed/daily_returns.csv')
+    save_dataframe(returns_pivot, 'data/processed/daily_returns.parquet', format='parquet')
     
     # Visualizations
     print("\n5. Creating visualizations...")
     set_plot_style()
     
     # Plot stock prices
-    fig1 = plot_stock_prices(stock_data)
-    plt.savefig('data/processed/stock_prices.png', dpi=300, bbox_inches='tight')
+    fig1 = plot_stock_prices(prices, ticker_col=None)
+    fig1.savefig('data/processed/stock_prices.png', dpi=150, bbox_inches='tight')
+    plt.close(fig1)
     
     # Plot correlation heatmap
     fig2 = plot_correlation_heatmap(correlation_matrix)
-    plt.savefig('data/processed/correlation_heatmap.png', dpi=300, bbox_inches='tight')
+    fig2.savefig('data/processed/correlation_heatmap.png', dpi=150, bbox_inches='tight')
+    plt.close(fig2)
     
     # Calculate risk-return profile
     avg_returns = returns_pivot.mean()
     volatility = returns_pivot.std() * (252 ** 0.5)  # Annualized
     
-    fig3 = plot_risk_return_scatter(volatility, avg_returns, labels=all_stocks)
-    plt.savefig('data/processed/risk_return.png', dpi=300, bbox_inches='tight')
+    fig3 = plot_risk_return_scatter(volatility, avg_returns,
+                                    labels=returns_pivot.columns.tolist())
+    fig3.savefig('data/processed/risk_return.png', dpi=150, bbox_inches='tight')
+    plt.close(fig3)
     
     print("\n✓ Analysis complete!")
     print("✓ Results saved to data/processed/")
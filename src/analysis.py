@@ -1,7 +1,8 @@
 import pandas as pd
 import numpy as np
 from scipy import stats
-from typing import Optional, Dict
+from numba import njit
+from typing import Optional, Dict, Union
 
 
 def calculate_descriptive_stats(
@@ -25,56 +26,120 @@ def calculate_correlation(
     if method not in ["pearson", "spearman", "kendall"]:
         raise ValueError(f"Unknown correlation method: {method}")
 
+    if method == "pearson":
+        # Rows that are entirely NaN (e.g. the first row of a returns panel) carry no
+        # pairs; once they are gone a complete matrix can go through a single GEMM.
+        numeric_df = numeric_df.dropna(how='all')
+        values = numeric_df.to_numpy(dtype=np.float64)
+        if len(values) > 1 and not np.isnan(values).any():
+            centered = values - values.mean(axis=0)
+            cov = centered.T @ centered / (len(values) - 1)
+            std = np.sqrt(np.diag(cov))
+            # Zero-variance columns give NaN, silently, as pandas corr() does
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr = np.clip(cov / np.outer(std, std), -1.0, 1.0)
+            return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+
     return numeric_df.corr(method=method)
 
 
+@njit
+def _rolling_std(x, window, scale):
+    # Running sums over each column (one ticker at a time), producing the scaled
+    # sample std of every full window; windows containing NaN yield NaN.
+    n_rows, n_cols = x.shape
+    out = np.empty_like(x)
+    for k in range(n_cols):
+        s = 0.0
+        s2 = 0.0
+        n_nan = 0
+        for i in range(n_rows):
+            v = x[i, k]
+            if v == v:
+                s += v
+                s2 += v * v
+            else:
+                n_nan += 1
+            if i >= window:
+                old = x[i - window, k]
+                if old == old:
+                    s -= old
+                    s2 -= old * old
+                else:
+                    n_nan -= 1
+            if i < window - 1 or n_nan > 0 or window < 2:
+                out[i, k] = np.nan
+            else:
+                var = (s2 - s * s / window) / (window - 1)
+                out[i, k] = np.sqrt(var) * scale if var > 0 else 0.0
+    return out
+
+
 def calculate_volatility(
-    returns: pd.Series,
+    returns: Union[pd.Series, pd.DataFrame],
     window: int = 30,
     annualize: bool = True
-) -> pd.Series:
+) -> Union[pd.Series, pd.DataFrame]:
 
-    volatility = returns.rolling(window=window).std()
+    scale = float(np.sqrt(252)) if annualize else 1.0  # 252 trading days per year
 
-    if annualize:
-        volatility = volatility * np.sqrt(252)  # 252 trading days per year
+    values = returns.to_numpy()
+    if values.dtype.kind != 'f':
+        values = values.astype(np.float64)
 
-    return volatility
+    # float32 panels stay float32, halving the memory traffic of the window pass
+    panel = values.reshape(-1, 1) if values.ndim == 1 else values
+    values = _rolling_std(panel, window, scale).reshape(values.shape)
 
+    if isinstance(returns, pd.DataFrame):
+        return pd.DataFrame(values, index=returns.index, columns=returns.columns)
+    return pd.Series(values, index=returns.index, name=returns.name)
 
-def calculate_sharpe_ratio(
-    returns: pd.Series,
+
+def sharpe_from_moments(
+    mean: Union[float, pd.Series],
+    std: Union[float, pd.Series],
     risk_free_rate: float = 0.02,
     periods_per_year: int = 252
-) -> float:
+) -> Union[float, pd.Series]:
 
-    excess_returns = returns - (risk_free_rate / periods_per_year)
-    mean_excess_return = excess_returns.mean()
-    std_excess_return = excess_returns.std()
-
-    if std_excess_return == 0:
+    if not isinstance(std, pd.Series) and std == 0:
         return 0.0
 
-    sharpe = (mean_excess_return / std_excess_return) * np.sqrt(periods_per_year)
+    sharpe = (mean - risk_free_rate / periods_per_year) / std * np.sqrt(periods_per_year)
+
+    if isinstance(sharpe, pd.Series):
+        return sharpe.where(std != 0, 0.0)
     return sharpe
 
 
+def calculate_sharpe_ratio(
+    returns: pd.Series,
+    risk_free_rate: float = 0.02,
+    periods_per_year: int = 252
+) -> float:
+
+    # Subtracting a constant rate does not change the std, so reuse the raw moments
+    return sharpe_from_moments(returns.mean(), returns.std(), risk_free_rate, periods_per_year)
+
+
 def calculate_max_drawdown(prices: pd.Series) -> Dict[str, float]:
 
-    cumulative_max = prices.expanding().max()
-    drawdown = (prices - cumulative_max) / cumulative_max
-    max_drawdown = drawdown.min()
+    values = prices.to_numpy(dtype=np.float64)
+    cumulative_max = np.fmax.accumulate(values)  # fmax skips NaN like expanding().max()
+    drawdown = (values - cumulative_max) / cumulative_max
 
-    max_drawdown_idx = drawdown.idxmin()
-    peak_idx = prices[:max_drawdown_idx].idxmax()
+    trough = np.nanargmin(drawdown)
+    peak = np.nanargmax(values[:trough + 1])
+    max_drawdown = drawdown[trough]
 
     return {
         'max_drawdown': max_drawdown,
         'max_drawdown_pct': max_drawdown * 100,
-        'peak_value': prices[peak_idx],
-        'trough_value': prices[max_drawdown_idx],
-        'peak_date': peak_idx,
-        'trough_date': max_drawdown_idx
+        'peak_value': values[peak],
+        'trough_value': values[trough],
+        'peak_date': prices.index[peak],
+        'trough_date': prices.index[trough]
     }
 
 
@@ -90,16 +155,44 @@ def calculate_moving_average(
     return series.rolling(window=window).mean()
 
 
-def detect_trends(series: pd.Series) -> Dict[str, float]:
-    x = np.arange(len(series))
-    y = series.values
-
-    # Remove NaN values
-    mask = ~np.isnan(y)
-    x = x[mask]
-    y = y[mask]
-
-    if len(x) < 2:
+@njit
+def _ols_moments(y):
+    # Centered moments for a closed-form OLS fit against the sample position,
+    # skipping NaN values. Values are shifted by the first valid one and the
+    # second pass works on deviations, so a flat series gives exactly zero.
+    n = 0
+    y0 = 0.0
+    sx = sy = 0.0
+    for i in range(len(y)):
+        v = y[i]
+        if v == v:
+            if n == 0:
+                y0 = v
+            sx += i
+            sy += v - y0
+            n += 1
+    if n == 0:
+        return 0, 0.0, 0.0, 0.0, 0.0, 0.0
+
+    mean_x = sx / n
+    mean_y = sy / n
+    ssx = ssxy = ssy = 0.0
+    for i in range(len(y)):
+        v = y[i]
+        if v == v:
+            dx = i - mean_x
+            dy = (v - y0) - mean_y
+            ssx += dx * dx
+            ssxy += dx * dy
+            ssy += dy * dy
+    return n, mean_x, mean_y + y0, ssx, ssxy, ssy
+
+
+def detect_trends(series: pd.Series, compute_p_value: bool = True) -> Dict[str, float]:
+    y = series.to_numpy(dtype=np.float64)
+    n, mean_x, mean_y, ssx, ssxy, ssy = _ols_moments(y)
+
+    if n < 2:
         return {
             'slope': 0,
             'intercept': 0,
@@ -108,7 +201,18 @@ def detect_trends(series: pd.Series) -> Dict[str, float]:
             'trend': 'insufficient_data'
         }
 
-    slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
+    slope = ssxy / ssx
+    intercept = mean_y - slope * mean_x
+    r_value = 0.0 if ssy <= 0 else float(np.clip(ssxy / np.sqrt(ssx * ssy), -1.0, 1.0))
+
+    p_value = np.nan
+    if compute_p_value:
+        if n == 2:
+            p_value = 1.0 if ssy <= 0 else 0.0
+        else:
+            dof = n - 2
+            t_stat = r_value * np.sqrt(dof / ((1.0 - r_value) * (1.0 + r_value) + 1e-20))
+            p_value = 2 * stats.t.sf(np.abs(t_stat), dof)
 
     if slope > 0:
         trend = "increasing"
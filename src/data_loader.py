@@ -1,16 +1,18 @@
 
 import pandas as pd
+import numpy as np
+import polars as pl
 import yfinance as yf
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
 
 
-def fetch_stock_data(
+def _download_batch(
     tickers: List[str],
     start_date: str,
     end_date: str,
-    interval: str = "1d"
+    interval: str
 ) -> pd.DataFrame:
 
     if not tickers:
@@ -24,35 +26,93 @@ def fetch_stock_data(
     
     print(f"Fetching data for {len(tickers)} stocks from {start_date} to {end_date}...")
     
-    all_data = []
+    data = yf.download(
+        tickers,
+        start=start_date,
+        end=end_date,
+        interval=interval,
+        group_by='ticker',
+        threads=True,
+        auto_adjust=True,
+        progress=False
+    )
+    
+    if data.empty:
+        raise ValueError("No data was successfully retrieved for any ticker")
+    
+    # A single ticker may come back without the ticker level on the columns
+    if not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({tickers[0]: data}, axis=1)
+    
+    data.columns = data.columns.set_names(['Ticker', 'Price'])
+    
+    return data
+
+
+def fetch_stock_data(
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    interval: str = "1d"
+) -> pd.DataFrame:
+
+    data = _download_batch(tickers, start_date, end_date, interval)
+    
+    # Reshape to long (Date, Ticker) rows in one pass instead of concatenating
+    # a reset copy of every ticker's frame
+    combined_data = data.stack(level=0).dropna(how='all').reset_index()
+    combined_data.columns.name = None
+    
+    # Keep the per-ticker layout: rows grouped by ticker in request order (dates
+    # ascending within each), with the Ticker column last
+    ticker_order = pd.Categorical(combined_data['Ticker'], categories=tickers).codes
+    combined_data = combined_data.iloc[np.argsort(ticker_order, kind='stable')]
+    combined_data = combined_data[
+        [col for col in combined_data.columns if col != 'Ticker'] + ['Ticker']
+    ].reset_index(drop=True)
     
+    records = combined_data['Ticker'].value_counts()
     for ticker in tickers:
-        try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(start=start_date, end=end_date, interval=interval)
-            
-            if hist.empty:
-                print(f"Warning: No data found for {ticker}")
-                continue
-            
-            hist['Ticker'] = ticker
-            hist.reset_index(inplace=True)
-            all_data.append(hist)
-            print(f"✓ Fetched {len(hist)} records for {ticker}")
-            
-        except Exception as e:
-            print(f"Error fetching data for {ticker}: {str(e)}")
-            continue
-    
-    if not all_data:
+        if ticker in records.index:
+            print(f"✓ Fetched {records[ticker]} records for {ticker}")
+        else:
+            print(f"Warning: No data found for {ticker}")
+    
+    if combined_data.empty:
         raise ValueError("No data was successfully retrieved for any ticker")
     
-    combined_data = pd.concat(all_data, ignore_index=True)
     print(f"\nTotal records fetched: {len(combined_data)}")
     
     return combined_data
 
 
+def fetch_price_panel(
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    interval: str = "1d",
+    price_column: str = "Close",
+    dtype: str = "float32"
+) -> pd.DataFrame:
+
+    data = _download_batch(tickers, start_date, end_date, interval)
+    
+    prices = data.xs(price_column, level=1, axis=1).reindex(columns=tickers)
+    
+    missing = prices.columns[prices.isna().all()]
+    for ticker in missing:
+        print(f"Warning: No data found for {ticker}")
+    
+    prices = prices.drop(columns=missing).dropna(how='all')
+    
+    if prices.empty:
+        raise ValueError("No data was successfully retrieved for any ticker")
+    
+    print(f"✓ Fetched {len(prices)} records for {prices.shape[1]} tickers")
+    
+    return prices.astype(dtype)
+
+
 def load_csv(file_path: str, **kwargs) -> pd.DataFrame:
 
     path = Path(file_path)
@@ -62,6 +122,15 @@ def load_csv(file_path: str, **kwargs) -> pd.DataFrame:
     return pd.read_csv(file_path, **kwargs)
 
 
+def scan_parquet(file_path: str, **kwargs) -> pl.LazyFrame:
+
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+    
+    return pl.scan_parquet(file_path, **kwargs)
+
+
 def save_dataframe(
     df: pd.DataFrame,
     file_path: str,
@@ -79,6 +148,8 @@ def save_dataframe(
     elif format == "excel":
         df.to_excel(file_path, index=False, **kwargs)
     elif format == "parquet":
+        kwargs.setdefault("engine", "pyarrow")
+        kwargs.setdefault("compression", "zstd")
         df.to_parquet(file_path, **kwargs)
     else:
         raise ValueError(f"Unsupported format: {format}")
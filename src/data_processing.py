@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+import numbagg
 from typing import Optional
 
 
@@ -8,14 +9,10 @@ def calculate_returns(
     price_column: str = 'Close',
     group_by: Optional[str] = 'Ticker'
 ) -> pd.DataFrame:
-    df_copy = df.copy()
-    
     if group_by:
-        df_copy['Returns'] = df_copy.groupby(group_by)[price_column].pct_change()
-    else:
-        df_copy['Returns'] = df_copy[price_column].pct_change()
+        return df.assign(Returns=df.groupby(group_by)[price_column].pct_change())
     
-    return df_copy
+    return df.assign(Returns=df[price_column].pct_change())
 
 
 def calculate_log_returns(
@@ -23,16 +20,13 @@ def calculate_log_returns(
     price_column: str = 'Close',
     group_by: Optional[str] = 'Ticker'
 ) -> pd.DataFrame:
-    df_copy = df.copy()
-    
     if group_by:
-        df_copy['Log_Returns'] = df_copy.groupby(group_by)[price_column].apply(
-            lambda x: np.log(x / x.shift(1))
-        )
+        previous = df.groupby(group_by)[price_column].shift(1)
+        log_returns = np.log(df[price_column].to_numpy() / previous.to_numpy())
     else:
-        df_copy['Log_Returns'] = np.log(df_copy[price_column] / df_copy[price_column].shift(1))
+        log_returns = np.log(df[price_column] / df[price_column].shift(1))
     
-    return df_copy
+    return df.assign(Log_Returns=log_returns)
 
 
 def handle_missing_values(
@@ -40,19 +34,26 @@ def handle_missing_values(
     strategy: str = "forward_fill"
 ) -> pd.DataFrame:
 
-
-    df_copy = df.copy()
-    
     if strategy == "drop":
-        return df_copy.dropna()
+        return df.dropna()
     elif strategy == "forward_fill":
-        return df_copy.fillna(method="ffill")
+        return df.ffill()
     elif strategy == "backward_fill":
-        return df_copy.fillna(method="bfill")
+        return df.bfill()
+    elif strategy == "forward_backward_fill":
+        # The array path needs one float dtype across all columns; anything else
+        # (ints, mixed floats, non-numeric) keeps per-column dtypes via pandas
+        dtypes = df.dtypes.unique()
+        if len(dtypes) != 1 or dtypes[0].kind != 'f':
+            return df.ffill().bfill()
+        values = df.to_numpy()
+        if not np.isnan(values).any():
+            return df
+        values = numbagg.bfill(numbagg.ffill(values, axis=0), axis=0)
+        return pd.DataFrame(values, index=df.index, columns=df.columns)
     elif strategy == "interpolate":
-        numeric_columns = df_copy.select_dtypes(include=[np.number]).columns
-        df_copy[numeric_columns] = df_copy[numeric_columns].interpolate(method='linear')
-        return df_copy
+        numeric_df = df.select_dtypes(include=[np.number])
+        return df.assign(**numeric_df.interpolate(method='linear'))
     else:
         raise ValueError(f"Unknown strategy: {strategy}")
 
@@ -64,24 +65,22 @@ def filter_outliers(
     threshold: float = 1.5
 ) -> pd.DataFrame:
 
-    df_copy = df.copy()
-    
-    if column not in df_copy.columns:
+    if column not in df.columns:
         raise ValueError(f"Column '{column}' not found in DataFrame")
     
-    if not pd.api.types.is_numeric_dtype(df_copy[column]):
+    if not pd.api.types.is_numeric_dtype(df[column]):
         raise ValueError(f"Column '{column}' is not numeric")
     
     if method == "iqr":
-        Q1 = df_copy[column].quantile(0.25)
-        Q3 = df_copy[column].quantile(0.75)
+        Q1 = df[column].quantile(0.25)
+        Q3 = df[column].quantile(0.75)
         IQR = Q3 - Q1
         lower_bound = Q1 - threshold * IQR
         upper_bound = Q3 + threshold * IQR
-        return df_copy[(df_copy[column] >= lower_bound) & (df_copy[column] <= upper_bound)]
+        return df[(df[column] >= lower_bound) & (df[column] <= upper_bound)]
     elif method == "z-score":
-        z_scores = np.abs((df_copy[column] - df_copy[column].mean()) / df_copy[column].std())
-        return df_copy[z_scores < threshold]
+        z_scores = np.abs((df[column] - df[column].mean()) / df[column].std())
+        return df[z_scores < threshold]
     else:
         raise ValueError(f"Unknown outlier detection method: {method}")
 
@@ -13,20 +13,61 @@ def set_plot_style(style: str = "whitegrid"):
     plt.rcParams['font.size'] = 11
 
 
+def _plot_panel(
+    ax: plt.Axes,
+    wide: pd.DataFrame,
+    scale: float = 1,
+    **kwargs
+) -> list:
+    # Draw every column of a wide date x ticker frame with a single ax.plot call
+    values = wide.to_numpy() * scale
+    missing = np.isnan(values)
+    if not missing.any():
+        lines = ax.plot(wide.index, values, **kwargs)
+    else:
+        # Ragged tickers: plot each over its own dates so gaps do not break the line
+        lines = [
+            ax.plot(wide.index[~mask], column[~mask], **kwargs)[0]
+            for column, mask in zip(values.T, missing.T)
+        ]
+    for line, ticker in zip(lines, wide.columns):
+        line.set_label(ticker)
+    return lines
+
+
+def _plot_by_ticker(
+    ax: plt.Axes,
+    df: pd.DataFrame,
+    date_col: str,
+    value_col: str,
+    ticker_col: str,
+    scale: float = 1,
+    **kwargs
+) -> list:
+    # pivot rejects duplicate (date, ticker) rows; keep the latest one for each
+    wide = (
+        df.drop_duplicates([date_col, ticker_col], keep='last')
+        .pivot(index=date_col, columns=ticker_col, values=value_col)
+        .reindex(columns=df[ticker_col].unique())
+    )
+    return _plot_panel(ax, wide, scale=scale, **kwargs)
+
+
 def plot_stock_prices(
     df: pd.DataFrame,
     date_col: str = 'Date',
     price_col: str = 'Close',
-    ticker_col: str = 'Ticker',
+    ticker_col: Optional[str] = 'Ticker',
     title: str = "Stock Prices Over Time"
 ) -> plt.Figure:
 
     fig, ax = plt.subplots(figsize=(14, 7))
     
-    for ticker in df[ticker_col].unique():
-        ticker_data = df[df[ticker_col] == ticker]
-        ax.plot(ticker_data[date_col], ticker_data[price_col], 
-                label=ticker, linewidth=2, marker='o', markersize=2)
+    if ticker_col:
+        _plot_by_ticker(ax, df, date_col, price_col, ticker_col, linewidth=2, rasterized=True)
+    else:
+        # Already a wide price panel indexed by date
+        _plot_panel(ax, df, linewidth=2, rasterized=True)
     
     ax.set_title(title, fontsize=16, fontweight='bold')
     ax.set_xlabel('Date', fontsize=12)
@@ -66,13 +107,30 @@ def plot_correlation_heatmap(
     corr_matrix: pd.DataFrame,
     title: str = "Stock Returns Correlation Matrix",
     cmap: str = "coolwarm",
-    annot: bool = True
+    annot: bool = True,
+    fmt: str = ".3f",
+    max_annotated: int = 12
 ) -> plt.Figure:
     fig, ax = plt.subplots(figsize=(10, 8))
     
-    sns.heatmap(corr_matrix, annot=annot, cmap=cmap, center=0, 
-                square=True, linewidths=1, ax=ax, fmt='.3f',
-                cbar_kws={'label': 'Correlation Coefficient'})
+    values = corr_matrix.to_numpy()
+    n_rows, n_cols = values.shape
+    
+    im = ax.imshow(values, cmap=cmap, vmin=-1, vmax=1)
+    fig.colorbar(im, ax=ax, shrink=0.8, label='Correlation Coefficient')
+    
+    ax.set_xticks(range(n_cols))
+    ax.set_yticks(range(n_rows))
+    ax.set_xticklabels(corr_matrix.columns, rotation=45, ha='right')
+    ax.set_yticklabels(corr_matrix.index)
+    ax.grid(False)
+    
+    # fmt is a format() spec, as in sns.heatmap; labels are skipped for large matrices
+    if annot and max(n_rows, n_cols) <= max_annotated:
+        colors = np.where(np.abs(values) > 0.6, 'white', 'black')
+        for (i, j), value in np.ndenumerate(values):
+            ax.text(j, i, format(value, fmt), ha='center', va='center',
+                    color=colors[i, j], fontsize=10)
     
     ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
     plt.tight_layout()
@@ -90,12 +148,11 @@ def plot_volatility(
     fig, ax = plt.subplots(figsize=(14, 7))
     
     if ticker_col:
-        for ticker in df[ticker_col].unique():
-            ticker_data = df[df[ticker_col] == ticker]
-            ax.plot(ticker_data[date_col], ticker_data[volatility_col], 
-                    label=ticker, linewidth=2)
+        _plot_by_ticker(ax, df, date_col, volatility_col, ticker_col,
+                        linewidth=2, rasterized=True)
     else:
-        ax.plot(df[date_col], df[volatility_col], linewidth=2, color='darkred')
+        ax.plot(df[date_col], df[volatility_col], linewidth=2, color='darkred',
+                rasterized=True)
     
     ax.set_title(title, fontsize=16, fontweight='bold')
     ax.set_xlabel('Date', fontsize=12)
@@ -146,10 +203,8 @@ def plot_cumulative_returns(
 
     fig, ax = plt.subplots(figsize=(14, 7))
     
-    for ticker in df[ticker_col].unique():
-        ticker_data = df[df[ticker_col] == ticker]
-        ax.plot(ticker_data[date_col], ticker_data[returns_col] * 100, 
-                label=ticker, linewidth=2)
+    _plot_by_ticker(ax, df, date_col, returns_col, ticker_col, scale=100,
+                    linewidth=2, rasterized=True)
     
     ax.set_title(title, fontsize=16, fontweight='bold')
     ax.set_xlabel('Date', fontsize=12)